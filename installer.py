@@ -7,13 +7,43 @@ Supports Windows, macOS, and Linux
 
 import os
 import sys
-import platform
-import subprocess
-import json
-import yaml
-import urllib.request
+import copy
+import functools
+import shutil
+import threading
+import time
 from pathlib import Path
-from typing import Dict, Any, Tuple
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+
+    def _json_loads(data: bytes) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+except ImportError:
+    def _json_loads(data: bytes) -> Any:
+        import json
+        return json.loads(data)
+
+    def _json_dumps(obj: Any) -> bytes:
+        import json
+        # Same output as the orjson branch: 2-space indent, raw UTF-8 and a trailing newline
+        return (json.dumps(obj, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+
+@functools.lru_cache(maxsize=1)
+def _platform_info() -> Tuple[str, str, str]:
+    """Return (system, machine, release), constant for the process so the platform module is queried once"""
+    import platform
+
+    return platform.system(), platform.machine(), platform.release()
+
+# Separator bars shared by the banners, section headers and prompts
+_SEP60 = "=" * 60
+_DASH60 = "─" * 60
+_DOT40 = "┄" * 40
 
 
 class Colors:
@@ -34,6 +64,28 @@ class Colors:
         """Clear the terminal screen"""
         os.system('cls' if os.name == 'nt' else 'clear')
 
+    @classmethod
+    def disable(cls):
+        """Replace every color code with an empty string"""
+        for name in ('RED', 'GREEN', 'YELLOW', 'BLUE', 'PURPLE', 'CYAN', 'WHITE', 'BOLD', 'UNDERLINE', 'END'):
+            setattr(cls, name, '')
+
+
+# Don't emit ANSI escapes into pipes/log files, or when NO_COLOR is set (https://no-color.org)
+if not (sys.stdout and sys.stdout.isatty()) or os.environ.get('NO_COLOR'):
+    Colors.disable()
+
+
+class ServiceField(NamedTuple):
+    """A single service configuration field, pre-resolved from SERVICE_CONFIGS"""
+    name: str
+    prompt: str
+    default: Optional[str]
+    is_int: bool
+    optional: bool
+    validate: Optional[str]
+    config: Dict[str, Any]
+
 
 class ConfigurationManager:
     """Handles user input and configuration validation"""
@@ -85,6 +137,9 @@ Users will type commands like: ?play song_name''',
         }
     }
     
+    # Required fields first (no default), then optional ones, prompted in a single pass
+    BASIC_FIELDS = {**REQUIRED_FIELDS, **OPTIONAL_FIELDS}
+    
     SERVICE_CONFIGS = {
         'vocard-db': {
             'username': {
@@ -309,21 +364,47 @@ Change localhost:8080 to your actual domain/port if different.''',
             }
         }
     }
+    
+    # SERVICE_CONFIGS resolved once into flat field tuples for the prompt loop
+    SERVICE_FIELDS = {
+        service: tuple(
+            ServiceField(
+                name=field,
+                prompt=field_config['prompt'],
+                default=str(field_config['default']) if field_config['default'] is not None else None,
+                is_int=field_config['type'] is int,
+                optional=field_config.get('optional', False),
+                validate=field_config.get('validate'),
+                config=field_config
+            )
+            for field, field_config in fields.items()
+        )
+        for service, fields in SERVICE_CONFIGS.items()
+    }
+
+    # Section title and display name for every service in SERVICE_CONFIGS, icons included
+    _SERVICE_META = {
+        'vocard-db': ('🗄️ VOCARD DB CONFIGURATION', 'Vocard Db'),
+        'manual-mongodb': ('⚙️ MANUAL MONGODB CONFIGURATION', 'Manual Mongodb'),
+        'lavalink': ('🎵 LAVALINK CONFIGURATION', 'Lavalink'),
+        'vocard-dashboard': ('🌐 VOCARD DASHBOARD CONFIGURATION', 'Vocard Dashboard')
+    }
 
     @staticmethod
     def display_field_help(field_config: dict):
         """Display detailed help information for a field"""
+        lines = []
         if 'description' in field_config:
-            print(f"\n{Colors.CYAN}{'─' * 60}{Colors.END}")
-            print(f"{Colors.CYAN}ℹ️  Help:{Colors.END}")
-            print(field_config['description'])
+            dash_bar = f"{Colors.CYAN}{_DASH60}{Colors.END}"
+            lines.extend(["", dash_bar, f"{Colors.CYAN}ℹ️  Help:{Colors.END}", field_config['description']])
             
             if field_config.get('help_url'):
-                print(f"\n{Colors.BLUE}📖 More info: {field_config['help_url']}{Colors.END}")
+                lines.extend(["", f"{Colors.BLUE}📖 More info: {field_config['help_url']}{Colors.END}"])
             
-            print(f"{Colors.CYAN}{'─' * 60}{Colors.END}")
+            lines.append(dash_bar)
         
-        print()  # Add spacing
+        lines.append("")  # Add spacing
+        sys.stdout.write("\n".join(lines) + "\n")
 
     @staticmethod
     def get_required_input(prompt: str, field_config: dict = None) -> str:
@@ -336,10 +417,13 @@ Change localhost:8080 to your actual domain/port if different.''',
             if value:
                 Colors.clear_screen()
                 return value
-            print(f"{Colors.RED}This field is required. Please enter a value.{Colors.END}")
+            error = f"{Colors.RED}This field is required. Please enter a value.{Colors.END}\n"
+            if not field_config:
+                sys.stdout.write(error)
+                continue
             
-            # Offer to show help again for complex fields
-            if field_config and input(f"{Colors.CYAN}Show help again? (y/N): {Colors.END}").strip().lower() == 'y':
+            # Offer to show help again for complex fields, sent together with the error in a single write
+            if input(f"{error}{Colors.CYAN}Show help again? (y/N): {Colors.END}").strip().lower() == 'y':
                 Colors.clear_screen()
                 ConfigurationManager.display_field_help(field_config)
 
@@ -371,12 +455,16 @@ Change localhost:8080 to your actual domain/port if different.''',
                 return False
             print(f"{Colors.RED}Please enter 'y' or 'n'{Colors.END}")
 
+    @staticmethod
+    def format_section_header(title: str, color: str = Colors.PURPLE) -> str:
+        """Return a section header as a single string"""
+        bar = f"{color}{_SEP60}{Colors.END}"
+        return f"\n{bar}\n{color}{Colors.BOLD}{title}{Colors.END}\n{bar}\n"
+
     @staticmethod
     def display_section_header(title: str, color: str = Colors.PURPLE):
         """Display a section header"""
-        print(f"\n{color}{'=' * 60}{Colors.END}")
-        print(f"{color}{Colors.BOLD}{title}{Colors.END}")
-        print(f"{color}{'=' * 60}{Colors.END}")
+        sys.stdout.write(ConfigurationManager.format_section_header(title, color))
 
     def collect_basic_configuration(self) -> Dict[str, Any]:
         """Collect basic bot configuration"""
@@ -384,21 +472,17 @@ Change localhost:8080 to your actual domain/port if different.''',
         
         config = {}
         
-        # Required fields
-        for i, (field, field_config) in enumerate(self.REQUIRED_FIELDS.items()):
+        for i, (field, field_config) in enumerate(self.BASIC_FIELDS.items()):
             if i > 0:
                 self.display_section_header("🤖 BASIC BOT CONFIGURATION")
-                print(f"\n{Colors.WHITE}{'┄' * 40}{Colors.END}")
+                print(f"\n{Colors.WHITE}{_DOT40}{Colors.END}")
             
             print(f"\n{Colors.BOLD}{Colors.YELLOW}📋 {field_config['prompt']}{Colors.END}")
-            config[field] = self.get_required_input(field_config['prompt'], field_config)
-        
-        # Optional fields
-        for field, field_config in self.OPTIONAL_FIELDS.items():
-            self.display_section_header("🤖 BASIC BOT CONFIGURATION")
-            print(f"\n{Colors.WHITE}{'┄' * 40}{Colors.END}")
-            print(f"\n{Colors.BOLD}{Colors.YELLOW}📋 {field_config['prompt']}{Colors.END}")
-            config[field] = self.get_optional_input(field_config['prompt'], field_config['default'], field_config)
+            default = field_config.get('default')
+            if default is None:
+                config[field] = self.get_required_input(field_config['prompt'], field_config)
+            else:
+                config[field] = self.get_optional_input(field_config['prompt'], default, field_config)
         
         print(f"\n{Colors.GREEN}✅ Basic configuration completed!{Colors.END}")
         return config
@@ -406,65 +490,54 @@ Change localhost:8080 to your actual domain/port if different.''',
     def collect_service_configuration(self, service_name: str) -> Dict[str, Any]:
         """Collect configuration for a specific service"""
         config = {}
-        service_config = self.SERVICE_CONFIGS[service_name]
         
-        # Service-specific icons and titles
-        service_icons = {
-            'vocard-db': '🗄️',
-            'lavalink': '🎵',
-            'vocard-dashboard': '🌐'
-        }
-        icon = service_icons.get(service_name, '⚙️')
-        service_title = f"{icon} {service_name.replace('-', ' ').title().upper()} CONFIGURATION"
+        service_title, display_name = self._SERVICE_META[service_name]
         
         self.display_section_header(service_title, Colors.CYAN)
         
-        for i, (field, field_config) in enumerate(service_config.items()):
+        for i, field in enumerate(self.SERVICE_FIELDS[service_name]):
             if i > 0:
                 self.display_section_header(service_title, Colors.CYAN)
-                print(f"\n{Colors.WHITE}{'┄' * 40}{Colors.END}")
+                print(f"\n{Colors.WHITE}{_DOT40}{Colors.END}")
             
-            print(f"\n{Colors.BOLD}{Colors.YELLOW}📋 {field_config['prompt']}{Colors.END}")
+            print(f"\n{Colors.BOLD}{Colors.YELLOW}📋 {field.prompt}{Colors.END}")
             
             while True:
-                # Check if field is explicitly marked as optional
-                is_optional = field_config.get('optional', False)
-                
-                if field_config['default'] is None and not is_optional:
-                    value = self.get_required_input(field_config['prompt'], field_config)
+                if field.default is None and not field.optional:
+                    value = self.get_required_input(field.prompt, field.config)
                 else:
-                    default_value = str(field_config['default']) if field_config['default'] is not None else ''
-                    value = self.get_optional_input(field_config['prompt'], default_value, field_config)
+                    value = self.get_optional_input(field.prompt, field.default or '', field.config)
                 
                 # If empty value is provided for optional field, use default or empty
                 if not value:
-                    if field_config['default'] is not None:
-                        value = str(field_config['default'])
-                    elif is_optional:
-                        config[field] = ""
+                    if field.default is not None:
+                        value = field.default
+                    elif field.optional:
+                        config[field.name] = ""
                         break
                     else:
                         # This shouldn't happen for required fields, but just in case
                         continue
                 
                 # Validate the input if validation is specified
-                if field_config.get('validate') == 'mongodb_url' and value:
+                if field.validate == 'mongodb_url' and value:
                     if not (value.startswith('mongodb://') or value.startswith('mongodb+srv://')):
                         print(f"{Colors.RED}Invalid MongoDB URL format. Must start with 'mongodb://' or 'mongodb+srv://'{Colors.END}")
                         continue
                 
                 # Convert value to the appropriate type
-                try:
-                    if field_config['type'] == int:
-                        config[field] = int(value)
-                    else:
-                        config[field] = value
-                    break  # Exit the loop if conversion succeeds
-                except ValueError:
-                    print(f"{Colors.RED}Invalid number format for {field_config['prompt']}. Please enter a valid number.{Colors.END}")
-                    continue  # Ask for input again
+                if field.is_int:
+                    # int() accepts a single leading sign, anything else would make it raise
+                    digits = value[1:] if value[:1] in '+-' else value
+                    if not digits.isdecimal():
+                        print(f"{Colors.RED}Invalid number format for {field.prompt}. Please enter a valid number.{Colors.END}")
+                        continue  # Ask for input again
+                    config[field.name] = int(value)
+                else:
+                    config[field.name] = value
+                break  # Exit the loop once the value is valid
         
-        print(f"\n{Colors.GREEN}✅ {service_name.replace('-', ' ').title()} configuration completed!{Colors.END}")
+        print(f"\n{Colors.GREEN}✅ {display_name} configuration completed!{Colors.END}")
         return config
 
     def collect_installation_directory(self, default_dir: Path) -> Path:
@@ -500,88 +573,403 @@ The installer will create this directory if it doesn't exist.''',
 class FileManager:
     """Handles file operations and downloads"""
     
+    MAX_CONCURRENT_DOWNLOADS = 4
+    URL_TEMPLATES = {
+        'bot_settings': "https://raw.githubusercontent.com/{repo}/main/settings%20Example.json",
+        'dashboard_settings': "https://raw.githubusercontent.com/{repo}-Dashboard/main/settings%20Example.json",
+        'lavalink_settings': "https://raw.githubusercontent.com/{repo}-Installer/main/lavalink/application.yml"
+    }
+
+    CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / ".cache") / "vocard-installer"
+    CACHE_MAX_AGE = 600  # Seconds a cached download is trusted without asking the server again
+
     def __init__(self, github_repo: str):
         self.github_repo = github_repo
-        self.urls = {
-            'docker_compose': f"https://raw.githubusercontent.com/{github_repo}-Installer/main/docker-compose.yml",
-            'bot_settings': f"https://raw.githubusercontent.com/{github_repo}/main/settings%20Example.json",
-            'dashboard_settings': f"https://raw.githubusercontent.com/{github_repo}-Dashboard/main/settings%20Example.json",
-            'lavalink_settings': f"https://raw.githubusercontent.com/{github_repo}-Installer/main/lavalink/application.yml"
-        }
+        # Raw content of downloaded YAML files, so they can be parsed without re-reading them
+        self.yaml_contents: Dict[str, bytes] = {}
+        # url -> {etag, last_modified, path, sha256, fetched_at} of previously downloaded files, loaded on first use
+        self._cache_index: Optional[Dict[str, Dict[str, Any]]] = None
+        self._cache_lock = threading.Lock()
+        self._opener = None
+        self._opener_lock = threading.Lock()
+
+    @functools.cached_property
+    def urls(self) -> Dict[str, str]:
+        """Download URLs for the configured GitHub repository"""
+        return {name: template.format(repo=self.github_repo) for name, template in self.URL_TEMPLATES.items()}
+
+    def _get_cache_entry(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return the cache entry for url if its cached file still exists"""
+        with self._cache_lock:
+            if self._cache_index is None:
+                try:
+                    with open(self.CACHE_DIR / "index.json", 'rb') as f:
+                        self._cache_index = _json_loads(f.read())
+                except (OSError, ValueError):
+                    self._cache_index = {}
+                # The cache is only an optimization, so an index of the wrong shape is simply started over
+                if not isinstance(self._cache_index, dict):
+                    self._cache_index = {}
+            entry = self._cache_index.get(url)
+        # Malformed entries count as a cache miss and get overwritten by the next download
+        if isinstance(entry, dict) and isinstance(entry.get('path'), str) and os.path.isfile(entry['path']):
+            return entry
+        return None
+
+    @staticmethod
+    def _read_cached(entry: Dict[str, Any]) -> Optional[bytes]:
+        """Return the cached content of entry, or None if it no longer matches its recorded SHA-256"""
+        import hashlib
+
+        try:
+            with open(entry['path'], 'rb') as f:
+                content = f.read()
+        except OSError:
+            return None
+        if hashlib.sha256(content).hexdigest() != entry.get('sha256'):
+            return None
+        return content
+
+    def _store_cache_entry(self, url: str, content: bytes, etag: Optional[str],
+                           last_modified: Optional[str], write_content: bool = True) -> None:
+        """Save downloaded content and its validators so the next run can skip or revalidate the download"""
+        import hashlib
+
+        if not etag and not last_modified:
+            return
+        try:
+            cached_path = self.CACHE_DIR / hashlib.sha1(url.encode("utf-8")).hexdigest()
+            if write_content:
+                self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                with open(cached_path, 'wb') as f:
+                    f.write(content)
+            with self._cache_lock:
+                self._cache_index[url] = {
+                    'etag': etag or '',
+                    'last_modified': last_modified or '',
+                    'path': str(cached_path),
+                    'sha256': hashlib.sha256(content).hexdigest(),
+                    'fetched_at': time.time()
+                }
+                with open(self.CACHE_DIR / "index.json", 'wb') as f:
+                    f.write(_json_dumps(self._cache_index))
+        except OSError:
+            # The cache is only an optimization, a failure here must not break the install
+            pass
+
+    def _get_opener(self):
+        """URL opener sharing one SSL context (and its loaded CA store) across all downloads"""
+        import ssl
+        import urllib.request
+
+        with self._opener_lock:
+            if self._opener is None:
+                context = ssl.create_default_context()
+                self._opener = urllib.request.build_opener(urllib.request.HTTPSHandler(context=context))
+            return self._opener
+
+    def fetch(self, url: str) -> bytes:
+        """Fetch url, serving it from the local cache when the server reports it unchanged"""
+        import gzip
+        import urllib.error
+        import urllib.request
+
+        entry = self._get_cache_entry(url)
+        cached = self._read_cached(entry) if entry else None
+        fetched_at = entry.get('fetched_at') if entry else None
+        if (cached is not None and isinstance(fetched_at, (int, float))
+                and time.time() - fetched_at < self.CACHE_MAX_AGE):
+            # Fetched moments ago (e.g. re-running after a failed step), skip the network entirely
+            return cached
+
+        headers = {'Accept-Encoding': 'gzip'}
+        cached_etag = entry.get('etag', '') if entry else ''
+        cached_last_modified = entry.get('last_modified', '') if entry else ''
+        if cached is not None:
+            if cached_etag:
+                headers['If-None-Match'] = cached_etag
+            if cached_last_modified:
+                headers['If-Modified-Since'] = cached_last_modified
+
+        request = urllib.request.Request(url, headers=headers)
+        try:
+            with self._get_opener().open(request, timeout=30) as response:
+                content = response.read()
+                if response.headers.get('Content-Encoding') == 'gzip':
+                    content = gzip.decompress(content)
+                etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+        except urllib.error.HTTPError as e:
+            if e.code != 304 or cached is None:
+                raise
+            # Unchanged upstream, only refresh the entry's timestamp
+            self._store_cache_entry(url, cached, cached_etag, cached_last_modified, write_content=False)
+            return cached
+
+        self._store_cache_entry(url, content, etag, last_modified)
+        return content
 
     def download_file(self, url: str, destination: Path) -> bool:
         """Download file from URL to destination"""
         try:
             print(f"{Colors.CYAN}Downloading {url.split('/')[-1]}{Colors.END}")
-            urllib.request.urlretrieve(url, destination)
+            content = self.fetch(url)
+            with open(destination, 'wb') as f:
+                f.write(content)
+            if destination.suffix in ('.yml', '.yaml'):
+                self.yaml_contents[str(destination)] = content
             print(f"{Colors.GREEN}Downloaded to {destination}{Colors.END}")
             return True
         except Exception as e:
             print(f"{Colors.RED}Failed to download {url}: {e}{Colors.END}")
             return False
 
-    def create_directory(self, path: Path) -> bool:
-        """Create directory if it doesn't exist"""
-        try:
-            path.mkdir(parents=True, exist_ok=True)
-            print(f"{Colors.GREEN}Created directory: {path}{Colors.END}")
-            return True
-        except Exception as e:
-            print(f"{Colors.RED}Failed to create directory {path}: {e}{Colors.END}")
-            return False
+    def create_directories(self, paths: List[Path]) -> bool:
+        """Create directories (and their parents) if they don't exist"""
+        for path in paths:
+            try:
+                path.mkdir(parents=True, exist_ok=True)
+            except Exception as e:
+                print(f"{Colors.RED}Failed to create directory {path}: {e}{Colors.END}")
+                return False
+        print(f"{Colors.GREEN}Created directories: {', '.join(str(path) for path in paths)}{Colors.END}")
+        return True
 
     def download_config_files(self, install_dir: Path, enabled_services: set) -> bool:
         """Download all required configuration files"""
-        # Create base directory
-        if not self.create_directory(install_dir):
-            return False
-
-        # Download docker-compose.yml
-        if not self.download_file(self.urls['docker_compose'], install_dir / "docker-compose.yml"):
-            return False
+        directories = [install_dir]
+        downloads = [(self.urls['bot_settings'], install_dir / "settings.json")]
 
-        # Download bot settings
-        if not self.download_file(self.urls['bot_settings'], install_dir / "settings.json"):
-            return False
-
-        # Download service-specific files
+        # Service-specific directories and files
         if 'lavalink' in enabled_services:
             lavalink_dir = install_dir / "lavalink"
-            if not self.create_directory(lavalink_dir):
-                return False
-            if not self.create_directory(lavalink_dir / "plugins"):
-                return False
-            if not self.create_directory(lavalink_dir / "logs"):
-                return False
-            if not self.download_file(self.urls['lavalink_settings'], lavalink_dir / "application.yml"):
-                return False
+            directories.extend([lavalink_dir / "plugins", lavalink_dir / "logs"])
+            downloads.append((self.urls['lavalink_settings'], lavalink_dir / "application.yml"))
 
         if 'vocard-dashboard' in enabled_services:
             dashboard_dir = install_dir / "dashboard"
-            if not self.create_directory(dashboard_dir):
-                return False
-            if not self.download_file(self.urls['dashboard_settings'], dashboard_dir / "settings.json"):
-                return False
+            directories.append(dashboard_dir)
+            downloads.append((self.urls['dashboard_settings'], dashboard_dir / "settings.json"))
+
+        # Create all directories before fetching the files that go into them
+        if not self.create_directories(directories):
+            return False
+
+        # Downloads are independent, so fetch them all at once
+        from concurrent.futures import ThreadPoolExecutor, as_completed
 
+        with ThreadPoolExecutor(max_workers=self.MAX_CONCURRENT_DOWNLOADS) as executor:
+            futures = [executor.submit(self.download_file, url, destination) for url, destination in downloads]
+            for future in as_completed(futures):
+                if not future.result():
+                    for pending in futures:
+                        pending.cancel()
+                    return False
         return True
 
 
 class ConfigFileUpdater:
     """Updates configuration files with user settings"""
 
+    # Mirrors docker-compose.yml in this repository, keep the two in sync
+    COMPOSE_HEADER = (
+        "# For installation instructions please visit - https://docs.vocard.xyz/latest/bot/setup/docker\n"
+        "# Generated by the Vocard installer, re-run it to change these settings.\n\n"
+    )
+    COMPOSE_TEMPLATE = {
+        'name': 'vocard',
+        'services': {
+            'lavalink': {
+                'container_name': 'lavalink',
+                'image': 'ghcr.io/lavalink-devs/lavalink:latest',
+                'restart': 'unless-stopped',
+                'environment': [
+                    '_JAVA_OPTIONS=-Xmx1G',
+                    'SERVER_PORT=2333',
+                    'LAVALINK_SERVER_PASSWORD=youshallnotpass'
+                ],
+                'volumes': [
+                    './lavalink/application.yml:/opt/Lavalink/application.yml',
+                    './lavalink/plugins:/opt/Lavalink/plugins',
+                    './lavalink/logs:/opt/Lavalink/logs'
+                ],
+                'networks': ['vocard'],
+                'expose': ['2333']
+            },
+            'spotify-tokener': {
+                'container_name': 'spotify-tokener',
+                'image': 'ghcr.io/topi314/spotify-tokener:master',
+                'restart': 'unless-stopped',
+                'environment': ['SPOTIFY_TOKENER_ADDR=0.0.0.0:49152'],
+                'networks': ['vocard'],
+                'expose': [49152],
+                'healthcheck': {
+                    'test': 'nc -z -v localhost 49152',
+                    'interval': '10s',
+                    'timeout': '5s',
+                    'retries': 5
+                }
+            },
+            'yt-cipher': {
+                'container_name': 'yt-cipher',
+                'image': 'ghcr.io/kikkia/yt-cipher:master',
+                'restart': 'unless-stopped',
+                'networks': ['vocard'],
+                'expose': [8001]
+            },
+            'vocard-db': {
+                'container_name': 'vocard-db',
+                'image': 'mongo:8',
+                'restart': 'unless-stopped',
+                'volumes': [
+                    './data/mongo/db:/data/db',
+                    './data/mongo/conf:/data/configdb'
+                ],
+                'environment': [
+                    'MONGO_INITDB_ROOT_USERNAME=admin',
+                    'MONGO_INITDB_ROOT_PASSWORD=admin'
+                ],
+                'expose': [27017],
+                'networks': ['vocard'],
+                'command': ['mongod', '--oplogSize=1024', '--wiredTigerCacheSizeGB=1', '--auth', '--noscripting'],
+                'healthcheck': {
+                    'test': 'echo \'db.runCommand("ping").ok\' | mongosh localhost:27017/test --quiet',
+                    'interval': '10s',
+                    'timeout': '5s',
+                    'retries': 5,
+                    'start_period': '10s'
+                }
+            },
+            'vocard-dashboard': {
+                'container_name': 'vocard-dashboard',
+                'image': 'ghcr.io/chocomeow/vocard-dashboard:latest',
+                'restart': 'unless-stopped',
+                'volumes': ['./dashboard/settings.json:/app/settings.json'],
+                'ports': ['8000:8000'],
+                'networks': ['vocard'],
+                'healthcheck': {
+                    'test': [
+                        'CMD', 'python', '-c',
+                        "import urllib.request; urllib.request.urlopen('http://localhost:8000/health').read()"
+                    ],
+                    'interval': '10s',
+                    'timeout': '5s',
+                    'retries': 5,
+                    'start_period': '10s'
+                }
+            },
+            'vocard': {
+                'container_name': 'vocard',
+                'restart': 'unless-stopped',
+                'image': 'ghcr.io/chocomeow/vocard:latest',
+                'volumes': ['./settings.json:/app/settings.json'],
+                'networks': ['vocard'],
+                'depends_on': {
+                    'vocard-db': {'condition': 'service_healthy'},
+                    'vocard-dashboard': {'condition': 'service_healthy'}
+                }
+            }
+        },
+        'networks': {
+            'vocard': {'name': 'vocard'}
+        }
+    }
+
+    def __init__(self):
+        # file_path -> parsed contents, edited in memory by the update_* methods and written once by commit()
+        self._parsed: Dict[str, Any] = {}
+        # file_path -> YAML comment header, files not listed here are written as JSON
+        self._yaml_headers: Dict[str, str] = {}
+
+    def _load_json(self, file_path: str) -> Any:
+        """Return the parsed JSON of file_path, reading it only on first access"""
+        if file_path not in self._parsed:
+            with open(file_path, 'rb') as f:
+                self._parsed[file_path] = _json_loads(f.read())
+        return self._parsed[file_path]
+
+    def _load_yaml(self, file_path: str, content: Optional[bytes] = None) -> Any:
+        """Return the parsed YAML of file_path, parsing it only on first access"""
+        if file_path not in self._parsed:
+            self._parsed[file_path] = self.load_yaml(file_path, content)
+            self._yaml_headers.setdefault(file_path, '')
+        return self._parsed[file_path]
+
+    def commit(self) -> bool:
+        """Write every edited file back to disk"""
+        success = True
+        for file_path, data in self._parsed.items():
+            try:
+                if file_path in self._yaml_headers:
+                    self.dump_yaml(file_path, data, self._yaml_headers[file_path])
+                else:
+                    with open(file_path, 'wb') as f:
+                        f.write(_json_dumps(data))
+            except Exception as e:
+                print(f"{Colors.RED}Failed to write {file_path}: {e}{Colors.END}")
+                success = False
+
+        self._parsed.clear()
+        self._yaml_headers.clear()
+        return success
+
     @staticmethod
-    def update_docker_compose(file_path: Path, config: Dict[str, Any], disabled_services: set) -> bool:
-        """Remove disabled services from docker-compose.yml"""
+    def load_yaml(file_path: str, content: Optional[bytes] = None) -> Any:
+        """Parse YAML from already downloaded content, or from file_path if not given"""
+        import hashlib
+
+        if content is None:
+            with open(file_path, 'rb') as f:
+                content = f.read()
+
+        # The upstream files rarely change, so reuse the JSON form of a previous parse when the source matches
+        cache_path = FileManager.CACHE_DIR / f"{hashlib.sha1(content).hexdigest()}.yml.json"
+        try:
+            with open(cache_path, 'rb') as f:
+                return _json_loads(f.read())
+        except (OSError, ValueError):
+            pass
+
+        import yaml
+
+        # Prefer the libyaml C loader when PyYAML was built with it
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+        data = yaml.load(content, Loader=loader)
+
         try:
-            with open(file_path, 'r', encoding="utf-8") as f:
-                docker_compose = yaml.safe_load(f)
+            serialized = _json_dumps(data)
+            # Only cache documents that survive the JSON round-trip unchanged (no dates, non-string keys, ...)
+            if _json_loads(serialized) == data:
+                FileManager.CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                with open(cache_path, 'wb') as f:
+                    f.write(serialized)
+        except (OSError, TypeError, ValueError):
+            pass
+        return data
+
+    @staticmethod
+    def dump_yaml(file_path: str, data: Any, header: str = '') -> None:
+        """Write data to file_path as YAML, optionally preceded by a comment header"""
+        import yaml
+
+        dumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+        with open(file_path, 'w', encoding="utf-8") as f:
+            f.write(header)
+            # No line rewrapping (libyaml rejects float('inf'), so use the largest C int) and no key sorting
+            yaml.dump(
+                data, f, Dumper=dumper, default_flow_style=False, indent=4,
+                width=2 ** 31 - 1, allow_unicode=True, sort_keys=False
+            )
+
+    def update_docker_compose(self, file_path: str, config: Dict[str, Any], disabled_services: set) -> bool:
+        """Write docker-compose.yml from the template without the disabled services"""
+        try:
+            docker_compose = copy.deepcopy(ConfigFileUpdater.COMPOSE_TEMPLATE)
 
             services: dict[str, Any] = docker_compose.get('services', {})
-            for service_name, service in services.copy().items():
-                if service_name in disabled_services:
-                    services.pop(service_name, None)
-                    continue
-                
+            for service_name in [name for name in services if name in disabled_services]:
+                services.pop(service_name)
+            
+            for service_name, service in services.items():
                 if service.get("depends_on"):
                     for dep in disabled_services:
                         service["depends_on"].pop(dep, None)
@@ -611,21 +999,19 @@ class ConfigFileUpdater:
                         f"import urllib.request; urllib.request.urlopen('http://localhost:{dashboard_config['port']}/health').read()"
                     ]
 
-            with open(file_path, 'w', encoding="utf-8") as f:
-                yaml.dump(docker_compose, f, default_flow_style=False, indent=4)
+            self._parsed[file_path] = docker_compose
+            self._yaml_headers[file_path] = self.COMPOSE_HEADER
 
-            print(f"{Colors.GREEN}Updated docker-compose.yml{Colors.END}")
+            print(f"{Colors.GREEN}Created docker-compose.yml{Colors.END}")
             return True
         except Exception as e:
             print(f"{Colors.RED}Failed to update docker-compose.yml: {e}{Colors.END}")
             return False
 
-    @staticmethod
-    def update_bot_settings(file_path: Path, config: Dict[str, Any]) -> bool:
+    def update_bot_settings(self, file_path: str, config: Dict[str, Any]) -> bool:
         """Update bot settings.json with user configuration"""
         try:
-            with open(file_path, 'r', encoding="utf-8") as f:
-                settings = json.load(f)
+            settings = self._load_json(file_path)
 
             # Basic settings
             settings['token'] = config['bot_token']
@@ -658,23 +1044,18 @@ class ConfigFileUpdater:
                     settings['ipc_client']['password'] = dashboard_config['password']
                     settings['ipc_client']['enable'] = True
 
-            with open(file_path, 'w', encoding="utf-8") as f:
-                json.dump(settings, f, indent=4)
-
             print(f"{Colors.GREEN}Updated bot settings.json{Colors.END}")
             return True
         except Exception as e:
             print(f"{Colors.RED}Failed to update bot settings.json: {e}{Colors.END}")
             return False
 
-    @staticmethod
-    def update_lavalink_settings(file_path: Path, config: Dict[str, Any]) -> bool:
+    def update_lavalink_settings(self, file_path: str, config: Dict[str, Any],
+                                 content: Optional[bytes] = None) -> bool:
         """Update lavalink application.yml"""
         try:
             lavalink_config = config['service_configs']['lavalink']
-            
-            with open(file_path, 'r', encoding="utf-8") as f:
-                settings = yaml.safe_load(f)
+            settings = self._load_yaml(file_path, content)
 
             # Update server settings
             settings['server']['port'] = int(lavalink_config['port'])
@@ -695,23 +1076,17 @@ class ConfigFileUpdater:
                     'userAgent': ''
                 }
 
-            with open(file_path, 'w', encoding="utf-8") as f:
-                yaml.dump(settings, f, default_flow_style=False, indent=4)
-
             print(f"{Colors.GREEN}Updated lavalink settings{Colors.END}")
             return True
         except Exception as e:
             print(f"{Colors.RED}Failed to update lavalink settings: {e}{Colors.END}")
             return False
 
-    @staticmethod
-    def update_dashboard_settings(file_path: Path, config: Dict[str, Any]) -> bool:
+    def update_dashboard_settings(self, file_path: str, config: Dict[str, Any]) -> bool:
         """Update dashboard settings.json"""
         try:
             dashboard_config = config['service_configs']['vocard-dashboard']
-            
-            with open(file_path, 'r', encoding="utf-8") as f:
-                settings = json.load(f)
+            settings = self._load_json(file_path)
 
             settings.update({
                 "host": dashboard_config['host'],
@@ -723,9 +1098,6 @@ class ConfigFileUpdater:
                 "secret_key": dashboard_config['secret_key']
             })
 
-            with open(file_path, 'w', encoding="utf-8") as f:
-                json.dump(settings, f, indent=4)
-
             print(f"{Colors.GREEN}Updated dashboard settings{Colors.END}")
             return True
         except Exception as e:
@@ -736,12 +1108,17 @@ class ConfigFileUpdater:
 class PermissionManager:
     """Handles file and directory permissions for Docker containers"""
     
+    # Cached for the whole run, call check_docker_permissions.cache_clear() to probe again
+    # (e.g. after the user was added to the docker group)
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def check_docker_permissions() -> Tuple[bool, str]:
         """Check if current user can run Docker commands"""
+        import subprocess
+
         try:
             result = subprocess.run(
-                "docker ps", shell=True, capture_output=True, 
+                ["docker", "ps"], shell=False, capture_output=True, 
                 text=True, timeout=10
             )
             if result.returncode == 0:
@@ -754,75 +1131,109 @@ class PermissionManager:
         except Exception as e:
             return False, f"Docker check failed: {e}"
     
+    @staticmethod
+    def _walk_chmod(root: str, dir_mode: int = 0o777, file_mode: int = 0o644) -> None:
+        """Chmod everything below root, reusing the entry types scandir already read"""
+        with os.scandir(root) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    os.chmod(entry.path, dir_mode)
+                    PermissionManager._walk_chmod(entry.path, dir_mode, file_mode)
+                else:
+                    os.chmod(entry.path, file_mode)
+    
     @staticmethod
     def fix_directory_permissions(directory: Path, recursive: bool = True) -> bool:
         """Fix directory permissions for Docker container access"""
         try:
-            # Set directory permissions to 777 (rwxr-xr-x)
-            os.chmod(directory, 0o777)
-            
-            if recursive and directory.is_dir():
-                for item in directory.rglob("*"):
-                    if item.is_dir():
-                        os.chmod(item, 0o777)  # Directories: 777
-                    else:
-                        os.chmod(item, 0o644)  # Files: 644
+            if not (recursive and directory.is_dir()):
+                # Set directory permissions to 777 (rwxr-xr-x)
+                os.chmod(directory, 0o777)
+            elif os.name != 'nt' and shutil.which("find"):
+                import subprocess
+
+                # Let find batch the chmod calls into a few execs instead of one syscall round-trip per entry
+                for entry_type, mode in (('d', '777'), ('f', '644')):
+                    subprocess.run(
+                        ["find", str(directory), "-type", entry_type, "-exec", "chmod", mode, "{}", "+"],
+                        check=True, capture_output=True
+                    )
+            else:
+                os.chmod(directory, 0o777)
+                PermissionManager._walk_chmod(str(directory))
             
             return True
         except PermissionError:
             return False
         except Exception:
             return False
+        finally:
+            PermissionManager._check_write_permissions_cached.cache_clear()
     
     @staticmethod
     def create_docker_directories(install_dir: Path, enabled_services: set) -> bool:
         """Create and set proper permissions for Docker directories"""
+        base = str(install_dir)
         directories_to_create = []
         
         # Lavalink directories
         if 'lavalink' in enabled_services:
             directories_to_create.extend([
-                install_dir / "lavalink" / "plugins",
-                install_dir / "lavalink" / "logs"
+                os.path.join(base, "lavalink", "plugins"),
+                os.path.join(base, "lavalink", "logs")
             ])
         
         # Dashboard directories
         if 'vocard-dashboard' in enabled_services:
-            directories_to_create.append(install_dir / "dashboard")
+            directories_to_create.append(os.path.join(base, "dashboard"))
         
         # Database directories (for persistent data)
         if 'vocard-db' in enabled_services:
-            directories_to_create.append(install_dir / "mongodb_data")
+            directories_to_create.append(os.path.join(base, "mongodb_data"))
         
         success = True
-        for directory in directories_to_create:
-            try:
-                directory.mkdir(parents=True, exist_ok=True)
-                
-                # Set permissions for Docker container access
-                if not PermissionManager.fix_directory_permissions(directory):
-                    print(f"{Colors.YELLOW}Warning: Could not set optimal permissions for {directory}{Colors.END}")
-                    print(f"{Colors.YELLOW}You may need to run: sudo chmod -R 777 {directory}{Colors.END}")
-                else:
-                    print(f"{Colors.GREEN}Created and set permissions for: {directory}{Colors.END}")
+        # Clear the umask so makedirs applies 0o777 as is and new directories need no chmod afterwards
+        previous_umask = os.umask(0)
+        try:
+            for directory in directories_to_create:
+                try:
+                    existed = os.path.isdir(directory)
+                    os.makedirs(directory, mode=0o777, exist_ok=True)
                     
-            except Exception as e:
-                print(f"{Colors.RED}Failed to create directory {directory}: {e}{Colors.END}")
-                success = False
+                    # Set permissions for Docker container access, only needed for directories that already existed
+                    if existed and not PermissionManager.fix_directory_permissions(Path(directory)):
+                        print(f"{Colors.YELLOW}Warning: Could not set optimal permissions for {directory}{Colors.END}")
+                        print(f"{Colors.YELLOW}You may need to run: sudo chmod -R 777 {directory}{Colors.END}")
+                    else:
+                        print(f"{Colors.GREEN}Created and set permissions for: {directory}{Colors.END}")
+                        
+                except Exception as e:
+                    print(f"{Colors.RED}Failed to create directory {directory}: {e}{Colors.END}")
+                    success = False
+        finally:
+            os.umask(previous_umask)
         
+        PermissionManager._check_write_permissions_cached.cache_clear()
         return success
     
     @staticmethod
     def check_write_permissions(install_dir: Path) -> bool:
         """Check if we have write permissions in the installation directory"""
-        test_file = install_dir / ".permission_test"
+        return PermissionManager._check_write_permissions_cached(str(install_dir))
+    
+    # Keyed by path (collect_configuration already resolved it), cleared whenever this class changes permissions under the install tree
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _check_write_permissions_cached(path_str: str) -> bool:
+        """Probe write access to path_str by creating and deleting a test file"""
+        test_file = os.path.join(path_str, ".permission_test")
         try:
             # Try to create a test file
             with open(test_file, 'w', encoding="utf-8") as f:
                 f.write("test")
             
             # Try to delete it
-            test_file.unlink()
+            os.unlink(test_file)
             return True
             
         except Exception:
@@ -831,47 +1242,73 @@ class PermissionManager:
     @staticmethod
     def suggest_permission_fixes(install_dir: Path) -> None:
         """Suggest permission fixes based on the system"""
-        system = platform.system().lower()
-        
-        print(f"\n{Colors.YELLOW}{'=' * 60}{Colors.END}")
-        print(f"{Colors.YELLOW}{Colors.BOLD}⚠️  PERMISSION ISSUES DETECTED{Colors.END}")
-        print(f"{Colors.YELLOW}{'=' * 60}{Colors.END}")
+        system = _platform_info()[0].lower()
+        bar = f"{Colors.YELLOW}{_SEP60}{Colors.END}"
         
-        print(f"\n{Colors.WHITE}To fix permission issues, try one of these solutions:{Colors.END}")
+        lines = [
+            "", bar,
+            f"{Colors.YELLOW}{Colors.BOLD}⚠️  PERMISSION ISSUES DETECTED{Colors.END}",
+            bar,
+            "", f"{Colors.WHITE}To fix permission issues, try one of these solutions:{Colors.END}"
+        ]
         
         if system == "linux":
-            print(f"\n{Colors.CYAN}Option 1 - Add user to docker group (recommended):{Colors.END}")
-            print(f"  sudo usermod -aG docker $USER")
-            print(f"  newgrp docker  # Or logout/login")
-            
-            print(f"\n{Colors.CYAN}Option 2 - Fix directory permissions:{Colors.END}")
-            print(f"  sudo chown -R $USER:$USER {install_dir}")
-            print(f"  sudo chmod -R 777 {install_dir}")
-            
-            print(f"\n{Colors.CYAN}Option 3 - Run installer with sudo:{Colors.END}")
-            print(f"  sudo python3 {sys.argv[0]}")
+            lines.extend([
+                "", f"{Colors.CYAN}Option 1 - Add user to docker group (recommended):{Colors.END}",
+                "  sudo usermod -aG docker $USER",
+                "  newgrp docker  # Or logout/login",
+                
+                "", f"{Colors.CYAN}Option 2 - Fix directory permissions:{Colors.END}",
+                f"  sudo chown -R $USER:$USER {install_dir}",
+                f"  sudo chmod -R 777 {install_dir}",
+                
+                "", f"{Colors.CYAN}Option 3 - Run installer with sudo:{Colors.END}",
+                f"  sudo python3 {sys.argv[0]}"
+            ])
             
         elif system == "darwin":  # macOS
-            print(f"\n{Colors.CYAN}Option 1 - Fix directory permissions:{Colors.END}")
-            print(f"  sudo chown -R $(whoami):staff {install_dir}")
-            print(f"  chmod -R 777 {install_dir}")
-            
-            print(f"\n{Colors.CYAN}Option 2 - Run installer with sudo:{Colors.END}")
-            print(f"  sudo python3 {sys.argv[0]}")
+            lines.extend([
+                "", f"{Colors.CYAN}Option 1 - Fix directory permissions:{Colors.END}",
+                f"  sudo chown -R $(whoami):staff {install_dir}",
+                f"  chmod -R 777 {install_dir}",
+                
+                "", f"{Colors.CYAN}Option 2 - Run installer with sudo:{Colors.END}",
+                f"  sudo python3 {sys.argv[0]}"
+            ])
         
-        print(f"\n{Colors.WHITE}After fixing permissions, run the installer again.{Colors.END}")
+        lines.extend(["", f"{Colors.WHITE}After fixing permissions, run the installer again.{Colors.END}"])
+        # Emit the whole hint block in a single write
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 class DockerManager:
     """Handles Docker operations"""
 
+    # Generous enough for a busy Docker Desktop, far below the compose timeout it guards against
+    DAEMON_PROBE_TIMEOUT = 20
+    COMPOSE_V2 = ("docker", "compose")
+    COMPOSE_V1 = ("docker-compose",)
+    # Lower-case stderr fragments that mean `up --pull always` failed while pulling, not while starting
+    PULL_ERROR_MARKERS = (
+        "pull access denied", "error pulling", "manifest unknown", "manifest for",
+        "toomanyrequests", "rate limit", "failed to resolve reference", "registry",
+        "no such host", "dial tcp"
+    )
+
+    def __init__(self):
+        # Compose command prefix found by check_docker_installation(), None if no compose is available
+        self.compose_cmd: Optional[Tuple[str, ...]] = None
+
     @staticmethod
-    def run_command(command: str, timeout: int = 1800) -> Tuple[bool, str, str]:
-        """Run system command safely"""
+    def run_command(argv: List[str], timeout: int = 1800,
+                    cwd: Optional[Path] = None) -> Tuple[bool, str, str]:
+        """Run system command safely without going through a shell"""
+        import subprocess
+
         try:
             result = subprocess.run(
-                command, shell=True, capture_output=True, 
-                text=True, timeout=timeout
+                argv, shell=False, capture_output=True, 
+                text=True, timeout=timeout, cwd=cwd
             )
             return result.returncode == 0, result.stdout, result.stderr
         except subprocess.TimeoutExpired:
@@ -879,52 +1316,99 @@ class DockerManager:
         except Exception as e:
             return False, "", str(e)
 
-    def check_docker_installation(self) -> Tuple[bool, bool]:
-        """Check if Docker and Docker Compose are installed"""
+    def check_docker_installation(self) -> Tuple[bool, Optional[Tuple[str, ...]]]:
+        """Check if Docker and Docker Compose are installed, returning the compose command to use"""
         print(f"{Colors.CYAN}Checking Docker installation...{Colors.END}")
         
-        docker_installed, _, _ = self.run_command("docker --version")
+        docker_installed = shutil.which("docker") is not None
         
-        # Check both docker compose (v2) and docker-compose (v1)
-        compose_v2, _, _ = self.run_command("docker compose version")
-        compose_v1, _, _ = self.run_command("docker-compose --version")
-        compose_installed = compose_v2 or compose_v1
+        # Check docker compose (v2) first, only fall back to docker-compose (v1) if it fails
+        self.compose_cmd = None
+        if docker_installed and self.run_command([*self.COMPOSE_V2, "version"], timeout=10)[0]:
+            self.compose_cmd = self.COMPOSE_V2
+        elif shutil.which("docker-compose") and self.run_command([*self.COMPOSE_V1, "--version"], timeout=10)[0]:
+            self.compose_cmd = self.COMPOSE_V1
+        
+        return docker_installed, self.compose_cmd
+
+    def docker_reachable(self) -> bool:
+        """Check whether the Docker daemon answers right now"""
+        # Deliberately uncached: the daemon may have stopped while the user was answering the prompts
+        success, _, _ = self.run_command(
+            ["docker", "info", "--format", "{{.ServerVersion}}"], timeout=self.DAEMON_PROBE_TIMEOUT
+        )
+        return success
+
+    @staticmethod
+    def format_service_status(output: str) -> str:
+        """Render `docker compose ps --format json` output as a compact service/state/status table"""
+        try:
+            # Older compose v2 releases print one JSON array, newer ones one object per line
+            stripped = output.strip()
+            if stripped.startswith('['):
+                containers = _json_loads(stripped)
+            else:
+                containers = [_json_loads(line) for line in stripped.splitlines() if line.strip()]
+            # str() so null or non-string fields can't break the column widths below
+            rows = [
+                tuple(str(c.get(key) or '') for key in ('Service', 'State', 'Status')) for c in containers
+            ]
+        except (ValueError, AttributeError, TypeError):
+            return output
         
-        return docker_installed, compose_installed
+        rows.insert(0, ("SERVICE", "STATE", "STATUS"))
+        service_width = max(len(row[0]) for row in rows) + 2
+        state_width = max(len(row[1]) for row in rows) + 2
+        return "\n".join(
+            f"{service:<{service_width}}{state:<{state_width}}{status}" for service, state, status in rows
+        )
 
-    def start_services(self, install_dir: Path) -> bool:
+    def start_services(self, install_dir: Path, show_status: bool = True) -> bool:
         """Start Docker services"""
         print(f"\n{Colors.BOLD}{Colors.CYAN}Starting Vocard services...{Colors.END}")
         
-        original_dir = os.getcwd()
-        try:
-            os.chdir(install_dir)
-            
-            # Pull images
+        # Fail fast instead of waiting out the long compose timeout against a dead daemon
+        if not self.docker_reachable():
+            print(f"{Colors.RED}Cannot connect to the Docker daemon. Make sure Docker is running and try again.{Colors.END}")
+            return False
+        
+        compose = self.compose_cmd or self.COMPOSE_V2
+        if compose == self.COMPOSE_V1:
+            # docker-compose v1 has no `up --pull`, so pull separately
             print(f"{Colors.CYAN}Pulling Docker images...{Colors.END}")
-            success, _, stderr = self.run_command("docker compose pull")
+            success, _, stderr = self.run_command([*compose, "pull"], cwd=install_dir)
             if not success:
                 print(f"{Colors.YELLOW}Pull failed: {stderr}{Colors.END}")
             
-            # Start services
             print(f"{Colors.CYAN}Starting services...{Colors.END}")
-            success, stdout, stderr = self.run_command("docker compose up -d")
+            success, stdout, stderr = self.run_command([*compose, "up", "-d"], cwd=install_dir)
+        else:
+            # Pull images and start services in a single compose invocation
+            print(f"{Colors.CYAN}Pulling Docker images and starting services...{Colors.END}")
+            success, stdout, stderr = self.run_command(
+                [*compose, "up", "-d", "--pull", "always"], cwd=install_dir
+            )
+            if not success and any(marker in stderr.lower() for marker in self.PULL_ERROR_MARKERS):
+                # A failed pull (rate limit, offline host, local-only tag) must not block starting from local images
+                print(f"{Colors.YELLOW}Pull failed: {stderr}{Colors.END}")
+                print(f"{Colors.CYAN}Starting services...{Colors.END}")
+                success, stdout, stderr = self.run_command([*compose, "up", "-d"], cwd=install_dir)
+        
+        if success:
+            print(f"{Colors.GREEN}Vocard services started successfully!{Colors.END}")
             
-            if success:
-                print(f"{Colors.GREEN}Vocard services started successfully!{Colors.END}")
-                
-                # Show service status
-                success_status, stdout_status, _ = self.run_command("docker compose ps")
+            # Show service status
+            if show_status:
+                # v1 only prints its own table, which format_service_status passes through unchanged
+                ps_args = ["ps"] if compose == self.COMPOSE_V1 else ["ps", "--format", "json"]
+                success_status, stdout_status, _ = self.run_command([*compose, *ps_args], cwd=install_dir)
                 if success_status:
                     print(f"\n{Colors.BLUE}Service Status:{Colors.END}")
-                    print(stdout_status)
-                return True
-            else:
-                print(f"{Colors.RED}Failed to start services: {stderr}{Colors.END}")
-                return False
-                
-        finally:
-            os.chdir(original_dir)
+                    print(self.format_service_status(stdout_status))
+            return True
+        else:
+            print(f"{Colors.RED}Failed to start services: {stderr}{Colors.END}")
+            return False
 
 
 class VocardInstaller:
@@ -937,11 +1421,16 @@ class VocardInstaller:
         "vocard-db": "🗄️ MongoDB - Database for user data and playlists (Required - if not enabled, you'll need to provide manual MongoDB connection)",
         "vocard-dashboard": "🌐 Web Dashboard - Web interface for bot management"
     }
+    # Service names only, for set arithmetic; the dict above keeps the prompt order
+    _OPTIONAL_SERVICES_SET = frozenset(OPTIONAL_SERVICES)
     GITHUB_REPO = "ChocoMeow/Vocard"
 
-    def __init__(self):
-        self.system = platform.system().lower()
-        self.architecture = platform.machine().lower()
+    def __init__(self, quiet: bool = False):
+        # Quiet mode (e.g. CI) skips the service status listing after start-up
+        self.quiet = quiet
+        system, machine, _ = _platform_info()
+        self.system = system.lower()
+        self.architecture = machine.lower()
         self.config_manager = ConfigurationManager()
         self.file_manager = FileManager(self.GITHUB_REPO)
         self.config_updater = ConfigFileUpdater()
@@ -950,37 +1439,41 @@ class VocardInstaller:
 
     def print_banner(self):
         """Print installation banner"""
-        print("=" * 60)
+        print(_SEP60)
         print(f"{Colors.BOLD}{Colors.CYAN}VOCARD INSTALLER{Colors.END}")
-        print("=" * 60)
-        print(f"{Colors.BLUE}System: {platform.system()} {platform.release()}{Colors.END}")
-        print(f"{Colors.BLUE}Architecture: {platform.machine()}{Colors.END}")
-        print("=" * 60)
+        print(_SEP60)
+        system, machine, release = _platform_info()
+        print(f"{Colors.BLUE}System: {system} {release}{Colors.END}")
+        print(f"{Colors.BLUE}Architecture: {machine}{Colors.END}")
+        print(_SEP60)
 
     def collect_configuration(self) -> Dict[str, Any]:
         """Collect all configuration from user"""
         # Installation directory
         default_dir = Path(__file__).parent.resolve()
-        install_dir = self.config_manager.collect_installation_directory(default_dir)
+        # Resolved once here, everything downstream works with this absolute path as is
+        install_dir = self.config_manager.collect_installation_directory(default_dir).resolve()
         
         # Basic configuration
         config = self.config_manager.collect_basic_configuration()
         config['install_dir'] = install_dir
         
         # Service configuration
-        self.config_manager.display_section_header("🔧 OPTIONAL SERVICES CONFIGURATION", Colors.CYAN)
-        print(f"{Colors.WHITE}Vocard supports several optional services that enhance functionality:{Colors.END}")
+        # Built once, the loop repeats it for every service after the first
+        services_header = (
+            self.config_manager.format_section_header("🔧 OPTIONAL SERVICES CONFIGURATION", Colors.CYAN)
+            + f"{Colors.WHITE}Vocard supports several optional services that enhance functionality:{Colors.END}\n"
+        )
+        divider = f"\n{Colors.WHITE}{_DOT40}{Colors.END}\n"
+        sys.stdout.write(services_header)
 
         config['service_configs'] = {}
         enabled_services = set()
 
         for i, (service, description) in enumerate(self.OPTIONAL_SERVICES.items()):
-            if i > 0:
-                self.config_manager.display_section_header("🔧 OPTIONAL SERVICES CONFIGURATION", Colors.CYAN)
-                print(f"{Colors.WHITE}Vocard supports several optional services that enhance functionality:{Colors.END}")
-                print(f"\n{Colors.WHITE}{'┄' * 40}{Colors.END}")
-            
-            print(f"\n{Colors.BLUE}{description}{Colors.END}")
+            # Every answer clears the screen, so later services get the header again, sent in the same write
+            prefix = f"{services_header}{divider}" if i > 0 else ""
+            sys.stdout.write(f"{prefix}\n{Colors.BLUE}{description}{Colors.END}\n")
             
             if self.config_manager.get_yes_no_input(f"{Colors.YELLOW}Enable {service}?{Colors.END}"):
                 enabled_services.add(service)
@@ -1020,32 +1513,36 @@ class VocardInstaller:
         if not self.permission_manager.create_docker_directories(install_dir, enabled_services):
             print(f"{Colors.YELLOW}Warning: Some directories could not be created with optimal permissions{Colors.END}")
         
+        # Build the config file paths once and hand plain strings to the updaters
+        compose_path = str(install_dir / "docker-compose.yml")
+        bot_settings_path = str(install_dir / "settings.json")
+        lavalink_path = str(install_dir / "lavalink" / "application.yml")
+        dashboard_path = str(install_dir / "dashboard" / "settings.json")
+        
         # Update docker-compose.yml
-        disabled_services = set(self.OPTIONAL_SERVICES.keys()) - enabled_services
-        if not self.config_updater.update_docker_compose(
-            install_dir / "docker-compose.yml", config, disabled_services
-        ):
+        disabled_services = self._OPTIONAL_SERVICES_SET - enabled_services
+        if not self.config_updater.update_docker_compose(compose_path, config, disabled_services):
             return False
         
         # Update bot settings
-        if not self.config_updater.update_bot_settings(
-            install_dir / "settings.json", config
-        ):
+        if not self.config_updater.update_bot_settings(bot_settings_path, config):
             return False
         
         # Update service-specific settings
         if 'lavalink' in enabled_services:
             if not self.config_updater.update_lavalink_settings(
-                install_dir / "lavalink" / "application.yml", config
+                lavalink_path, config, self.file_manager.yaml_contents.get(lavalink_path)
             ):
                 return False
         
         if 'vocard-dashboard' in enabled_services:
-            if not self.config_updater.update_dashboard_settings(
-                install_dir / "dashboard" / "settings.json", config
-            ):
+            if not self.config_updater.update_dashboard_settings(dashboard_path, config):
                 return False
         
+        # Write all edited files in one pass
+        if not self.config_updater.commit():
+            return False
+        
         # Final permission check and fix for all created files
         print(f"{Colors.CYAN}Fixing file permissions...{Colors.END}")
         if not self.permission_manager.fix_directory_permissions(install_dir):
@@ -1058,7 +1555,7 @@ class VocardInstaller:
 
     def print_success_message(self, config: Dict[str, Any]):
         """Print installation success message"""
-        print("\n" + "=" * 60)
+        print("\n" + _SEP60)
         print(f"{Colors.BOLD}{Colors.GREEN}VOCARD INSTALLATION COMPLETED!{Colors.END}")
         print(f"{Colors.GREEN}You can invite your bot using the following link:\nhttps://discord.com/oauth2/authorize?client_id={config['client_id']}&permissions=8&scope=bot+applications.commands{Colors.END}")
         
@@ -1066,14 +1563,16 @@ class VocardInstaller:
             dashboard_port = config['service_configs']['vocard-dashboard']['port']
             print(f"{Colors.GREEN}Access the dashboard at: http://localhost:{dashboard_port}{Colors.END}")
             
-        print("=" * 60)
+        print(_SEP60)
         print(f"{Colors.BLUE}Installation directory: {config['install_dir']}{Colors.END}")
         print(f"\n{Colors.CYAN}Management Commands:{Colors.END}")
         print(f"  cd {config['install_dir']}")
-        print("  docker compose up -d    # Start services")
-        print("  docker compose down     # Stop services")
-        print("  docker compose logs -f  # View logs")
-        print("  docker compose pull     # Update images")
+        # Show the compose flavour that was actually detected (docker compose or docker-compose)
+        compose = ' '.join(self.docker_manager.compose_cmd or DockerManager.COMPOSE_V2)
+        print(f"  {compose + ' up -d':<23} # Start services")
+        print(f"  {compose + ' down':<23} # Stop services")
+        print(f"  {compose + ' logs -f':<23} # View logs")
+        print(f"  {compose + ' pull':<23} # Update images")
         
         print(f"\n{Colors.YELLOW}Troubleshooting:{Colors.END}")
         print("  If containers can't write to directories:")
@@ -1083,33 +1582,45 @@ class VocardInstaller:
         print("    sudo usermod -aG docker $USER && newgrp docker")
         
         print(f"\n{Colors.YELLOW}For support, visit: https://github.com/{self.GITHUB_REPO}{Colors.END}")
-        print("=" * 60)
+        print(_SEP60)
+
+    def _preflight(self) -> Tuple[List[str], bool]:
+        """Check Docker, Docker Compose and Docker permissions, returning (errors, show_permission_hints)"""
+        from concurrent.futures import ThreadPoolExecutor
+
+        # Both probes mostly wait on docker subprocesses, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            installation_future = executor.submit(self.docker_manager.check_docker_installation)
+            permissions_future = executor.submit(self.permission_manager.check_docker_permissions)
+            docker_installed, compose_cmd = installation_future.result()
+            docker_perms_ok, docker_msg = permissions_future.result()
+        
+        errors = []
+        if not docker_installed:
+            errors.append("Docker is not installed. Please install Docker manually.")
+        if not compose_cmd:
+            errors.append("Docker Compose is not available. Please install it manually.")
+        # Without the docker CLI the permission probe can only fail, which is already reported above
+        permission_issue = docker_installed and not docker_perms_ok
+        if permission_issue:
+            errors.append(f"Docker permission issue: {docker_msg}")
+        
+        return errors, permission_issue
 
     def run(self) -> bool:
         """Main installation process"""
         try:
             self.print_banner()
             
-            # Check Docker installation
-            docker_installed, compose_installed = self.docker_manager.check_docker_installation()
-            
-            if not docker_installed:
-                print(f"{Colors.RED}Docker is not installed. Please install Docker manually.{Colors.END}")
-                return False
-            
-            if not compose_installed:
-                print(f"{Colors.RED}Docker Compose is not available. Please install it manually.{Colors.END}")
+            # Check Docker installation and permissions before asking any questions
+            errors, show_permission_hints = self._preflight()
+            if errors:
+                sys.stdout.write("".join(f"{Colors.RED}{error}{Colors.END}\n" for error in errors))
+                if show_permission_hints:
+                    self.permission_manager.suggest_permission_fixes(Path.cwd())
                 return False
             
             print(f"{Colors.GREEN}Docker and Docker Compose are available{Colors.END}")
-            
-            # Check Docker permissions
-            docker_perms_ok, docker_msg = self.permission_manager.check_docker_permissions()
-            if not docker_perms_ok:
-                print(f"{Colors.RED}Docker permission issue: {docker_msg}{Colors.END}")
-                self.permission_manager.suggest_permission_fixes(Path.cwd())
-                return False
-            
             print(f"{Colors.GREEN}Docker permissions are OK{Colors.END}")
             
             # Collect configuration
@@ -1129,7 +1640,7 @@ class VocardInstaller:
                 return False
             
             # Start services
-            if not self.docker_manager.start_services(config['install_dir']):
+            if not self.docker_manager.start_services(config['install_dir'], show_status=not self.quiet):
                 return False
             
             # Print success message
@@ -1147,7 +1658,7 @@ class VocardInstaller:
 
 def main():
     """Main entry point"""
-    installer = VocardInstaller()
+    installer = VocardInstaller(quiet="--quiet" in sys.argv[1:])
     success = installer.run()
     sys.exit(0 if success else 1)
 